@@ -26,6 +26,8 @@ class FileHandle(object):
     unique identifier and a file name. Files are maintaind in folders on the
     file system.
     """
+    __slots__ = ('filepath', 'identifier', 'file_name')
+
     def __init__(self, filepath, identifier=None, file_name=None):
         """Initialize the file identifier, the (full) file path, and the file
         name. The file path is mandatory.
@@ -80,6 +82,8 @@ class InputFile(object):
     'file'. This class extends the handle for an uploaded file with an optional
     target path that the user may have provided.
     """
+    __slots__ = ('f_handle', 'target_path')
+
     def __init__(self, f_handle, target_path=None):
         """Initialize the object properties.
 
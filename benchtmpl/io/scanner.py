@@ -14,6 +14,7 @@ that are supported for parameter declarations.
 
 from abc import abstractmethod
 from builtins import input
+from collections import deque
 
 
 class Scanner(object):
@@ -172,7 +173,9 @@ class InputReader(TokenReader):
 
 class ListReader(TokenReader):
     """Token reader that is initialized with a list of values. Returns tokens
-    from the list until the end of the list is reached.
+    from the list until the end of the list is reached. Tokens are maintained
+    in a double-ended queue to avoid shifting the remaining list elements when
+    a token is read.
     """
     def __init__(self, tokens):
         """Initialize the list of tokens.
@@ -182,7 +185,7 @@ class ListReader(TokenReader):
         tokens: list(string)
             List of token values
         """
-        self.tokens = tokens
+        self.reset(tokens)
 
     def next_token(self):
         """Return next token from the token list. If the end of the list has
@@ -192,7 +195,19 @@ class ListReader(TokenReader):
         -------
         string
         """
-        if len(self.tokens) > 0:
-            return str(self.tokens.pop(0))
+        if self.tokens:
+            return str(self.tokens.popleft())
         else:
             return None
+
+    def reset(self, tokens):
+        """Replace the remaining tokens with the given list of token values.
+        Allows to re-use the reader (and a scanner that uses the reader) for
+        a new list of input values.
+
+        Parameters
+        ----------
+        tokens: list(string)
+            List of token values
+        """
+        self.tokens = deque(tokens)
@@ -15,6 +15,7 @@ import datetime
 import errno
 import json
 import os
+import re
 import uuid
 import yaml
 
@@ -24,6 +25,29 @@ FORMAT_JSON = 'JSON'
 FORMAT_YAML = 'YAML'
 
 
+"""Mapping of file suffixes to data formats. Files with other suffixes are
+expected to be in YAML format.
+"""
+FORMAT_SUFFIXES = {'.json': FORMAT_JSON, '.yaml': FORMAT_YAML, '.yml': FORMAT_YAML}
+
+
+"""Loader for YAML files. Use the libyaml-based loader if PyYAML was built
+with libyaml support.
+"""
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+"""Parser for timestamps in ISO format. The C-implemented parser is only
+available for Python 3.7 and above. It accepts more formats than strptime()
+(and different formats for different Python versions). It is therefore only
+used for timestamps that match the pattern that strptime() accepts.
+"""
+FROM_ISO_FORMAT = getattr(datetime.datetime, 'fromisoformat', None)
+ISO_TIMESTAMP = re.compile(
+    r'[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}(\.[0-9]{1,6})?$'
+)
+
+
 def create_dir(directory):
     """Safely create the given directory path if it does not exist.
 
@@ -51,6 +75,58 @@ def get_unique_identifier():
     return str(uuid.uuid4()).replace('-', '')
 
 
+def get_file_version(filename):
+    """Get the device, inode, modification time, and size of a file. The
+    result is used to detect changes to files whose parsed content is cached.
+    The device and inode distinguish files that replaced a deleted file at the
+    same path, e.g., copies that kept the modification time of their source.
+    Uses the modification time in nanoseconds if available (Python 3.3+).
+
+    Parameters
+    ----------
+    filename: string
+        Path to file on disk
+
+    Returns
+    -------
+    tuple
+
+    Raises
+    ------
+    OSError
+    """
+    stat = os.stat(filename)
+    return (
+        stat.st_dev,
+        stat.st_ino,
+        getattr(stat, 'st_mtime_ns', stat.st_mtime),
+        stat.st_size
+    )
+
+
+def get_format(filename, format=None):
+    """Get the identifier for the data format of a file. If no format is given
+    the format is guessed based on the file suffix. Files with a suffix that
+    is not in FORMAT_SUFFIXES are expected to be in YAML format.
+
+    Parameters
+    ----------
+    filename: string
+        Path to file on disk
+    format: string, optional
+        Optional file format identifier
+
+    Returns
+    -------
+    string
+    """
+    # Guess format based on file suffix if not given
+    if format is None:
+        suffix = os.path.splitext(filename)[1]
+        return FORMAT_SUFFIXES.get(suffix, FORMAT_YAML)
+    return format.upper()
+
+
 def get_short_identifier():
     """Create a unique identifier that contains only eigth characters. Uses the
     prefix of a unique identifier as the result.
@@ -81,19 +157,16 @@ def read_object(filename, format=None):
     ------
     ValueError
     """
-    # Guess format based on file suffix if not given
-    if format is None:
-        if filename.endswith('.json'):
-            format = FORMAT_JSON
-        else:
-            format = FORMAT_YAML
-    if format.upper() == FORMAT_YAML:
-        with open(filename, 'r') as f:
+    format = get_format(filename, format=format)
+    if format == FORMAT_YAML:
+        # Pass the binary file object to the loader to avoid decoding the
+        # file contents into an intermediate string
+        with open(filename, 'rb') as f:
             try:
-                return yaml.load(f.read(), Loader=yaml.FullLoader)
+                return yaml.load(f, Loader=YAML_LOADER)
             except yaml.parser.ParserError as ex:
                 raise ValueError(ex)
-    elif format.upper() == FORMAT_JSON:
+    elif format == FORMAT_JSON:
         with open(filename, 'r') as f:
             return json.load(f)
     else:
@@ -101,7 +174,11 @@ def read_object(filename, format=None):
 
 
 def to_datetime(timestamp):
-    """Converts a timestamp string in ISO format into a datatime object.
+    """Converts a timestamp string in ISO format into a datatime object. Only
+    timestamps in format YYYY-MM-DDTHH:MM:SS[.ffffff] without time zone are
+    accepted. Uses datetime.fromisoformat() if available. Falls back to
+    parsing the timestamp with strptime() for older Python versions and for
+    timestamps that fromisoformat() does not accept.
 
     Parameters
     ----------
@@ -113,6 +190,13 @@ def to_datetime(timestamp):
     datatime.datetime
         Datetime object
     """
+    if not FROM_ISO_FORMAT is None and ISO_TIMESTAMP.match(timestamp):
+        try:
+            dt = FROM_ISO_FORMAT(timestamp)
+            if dt.tzinfo is None:
+                return dt
+        except ValueError:
+            pass
     try:
         return datetime.datetime.strptime(timestamp, '%Y-%m-%dT%H:%M:%S.%f')
     except ValueError:
@@ -133,15 +217,11 @@ def write_object(filename, obj, format=None):
     ------
     ValueError
     """
-    if format is None:
-        if filename.endswith('.json'):
-            format = FORMAT_JSON
-        else:
-            format = FORMAT_YAML
-    if format.upper() == FORMAT_YAML:
+    format = get_format(filename, format=format)
+    if format == FORMAT_YAML:
         with open(filename, 'w') as f:
             yaml.dump(obj, f)
-    elif format.upper() == FORMAT_JSON:
+    elif format == FORMAT_JSON:
         with open(filename, 'w') as f:
             json.dump(obj, f)
     else:
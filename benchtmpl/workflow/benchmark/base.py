@@ -25,6 +25,8 @@ class BenchmarkTemplate(TemplateHandle):
     """Extended workflow template for data analytics benchmarks that add the
     result schema object to the base template.
     """
+    __slots__ = ('schema',)
+
     def __init__(self, workflow_spec, schema, identifier=None, base_dir=None, parameters=None):
         """Initialize the components of the benchmark template. A super class
         raises an error if the identifier of template parameters are not unique.
@@ -242,6 +242,56 @@ class BenchmarkResultSchema(object):
 # Helper Methods
 # ------------------------------------------------------------------------------
 
+def column_declaration(
+        identifier, name, data_type, required=None, is_default=None,
+        sort_order=None
+    ):
+    """Create a dictionary that contains the serialization of a result schema
+    column. The result is the same as the dictionary returned by the to_dict()
+    method of a BenchmarkResultColumn that was created using the same
+    arguments. The column object itself is not created.
+
+    Raises ValueError if the data type is not in the list of supported data
+    types.
+
+    Parameters
+    ----------
+    identifier: string
+        Unique column identifier
+    name: string
+        Unique column name
+    data_type: string
+        Data type identifier
+    required: bool, optional
+        Indicates whether a value is expected for this column in every
+        benchmark run result. The default is True.
+    is_default: bool, optional
+        Indicates whether this column is the default sort column for the
+        benchmark leaderboard. The default is False.
+    sort_order: string, optional
+        Sort order for this column when generating the leaderboard. The default
+        is SORT_DESC.
+
+    Returns
+    -------
+    dict
+
+    Raises
+    ------
+    ValueError
+    """
+    if not data_type in DATA_TYPES:
+        raise ValueError('unknown data type \'{}\''.format(data_type))
+    return {
+        LABEL_ID: identifier,
+        LABEL_NAME: name,
+        LABEL_TYPE: data_type,
+        LABEL_REQUIRED: required if not required is None else True,
+        LABEL_IS_DEFAULT: is_default if not is_default is None else False,
+        LABEL_SORT_ORDER: sort_order if not sort_order is None else SORT_DESC
+    }
+
+
 def validate_doc(doc, mandatory_labels, optional_labels=[]):
     """Raises error if the dictionary contains labels that are not in the given
     label lists or if there are labels in the mandatory list that are not in the
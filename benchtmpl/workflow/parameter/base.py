@@ -11,6 +11,10 @@ properties that are used to (i) identify the parameter, (ii) define a nested
 parameter structure, and (iii) render UI forms to collect parameter values.
 """
 
+from operator import attrgetter
+
+import sys
+
 from benchtmpl.error import InvalidParameterError
 
 import benchtmpl.workflow.parameter.declaration as pd
@@ -22,14 +26,31 @@ uploaded files.
 AS_INPUT = '$input'
 
 
+"""Sort key for lists of parameter declarations. Parameters are sorted by
+their index value. Ties are broken using the unique parameter identifier.
+"""
+SORT_KEY = attrgetter('index', 'identifier')
+
+
+"""Function to intern strings. Python 2 provides intern as a builtin."""
+try:
+    INTERN = sys.intern
+except AttributeError:  # pragma: no cover
+    INTERN = intern  # noqa: F821
+
+
 class ParameterBase(object):
     """Base class for template parameter and parameter argument values. The
     base class maintains the unique parameter identifier and the information
     about the data type.
     """
+    __slots__ = ('identifier', 'data_type')
+
     def __init__(self, identifier, data_type):
         """Initialize the unique identifier and data type. Raises value error
-        if the given data type identifier is not valid.
+        if the given data type identifier is not valid. String identifier are
+        interned since they are used as keys in parameter and argument
+        dictionaries.
 
         Parameters
         ----------
@@ -44,6 +65,8 @@ class ParameterBase(object):
         """
         if not data_type in pd.DATA_TYPES:
             raise InvalidParameterError('invalid data type \'{}\''.format(data_type))
+        if isinstance(identifier, str):
+            identifier = INTERN(identifier)
         self.identifier = identifier
         self.data_type = data_type
 
@@ -116,6 +139,11 @@ class TemplateParameter(ParameterBase):
     contains a parameter declaration. The wrapper provides easy access to the
     different components of the parameter declaration.
     """
+    __slots__ = (
+        'obj', 'name', 'description', 'index', 'default_value', 'is_required',
+        'values', 'parent', 'as_constant', '_children', 'children_ids'
+    )
+
     def __init__(self, obj, children=None):
         """Initialize the different attributes of a template parameter
         declaration from a given dictionary.
@@ -125,7 +153,8 @@ class TemplateParameter(ParameterBase):
         obj: dict
             Dictionary containing the template parameter declaration properties
         children: list(benchtmpl.workflow.parameter.base.TemplateParameter), optional
-            Optional list of parameter children for parameter lists or records
+            Optional list of parameter children for parameter lists or records.
+            The children are maintained as an immutable tuple.
         """
         super(TemplateParameter, self).__init__(
             identifier=obj[pd.LABEL_ID],
@@ -150,8 +179,36 @@ class TemplateParameter(ParameterBase):
         para: benchtmpl.workflow.parameter.base.TemplateParameter
             Template parameter instance for child parameter
         """
-        self.children.append(para)
-        self.children.sort(key=lambda p: (p.index, p.identifier))
+        children = list(self.children) + [para]
+        self.children = sorted(children, key=SORT_KEY)
+
+    @property
+    def children(self):
+        """Tuple of children for parameters of type DT_LIST or DT_RECORD. The
+        value is None for parameters that cannot have children.
+
+        Returns
+        -------
+        tuple(benchtmpl.workflow.parameter.base.TemplateParameter)
+        """
+        return self._children
+
+    @children.setter
+    def children(self, children):
+        """Set the children of the parameter. The given list is maintained as
+        an immutable tuple. Also updates the set of child identifier.
+
+        Parameters
+        ----------
+        children: list(benchtmpl.workflow.parameter.base.TemplateParameter)
+            List of parameter children or None
+        """
+        if not children is None:
+            self._children = tuple(children)
+            self.children_ids = frozenset(p.identifier for p in self._children)
+        else:
+            self._children = None
+            self.children_ids = frozenset()
 
     def as_input(self):
         """Flag indicating whether the value for the as constant property is
@@ -181,6 +238,20 @@ class TemplateParameter(ParameterBase):
             return len(self.children) > 0
         return False
 
+    def has_child(self, identifier):
+        """Test if the parameter has a child with the given identifier.
+
+        Parameters
+        ----------
+        identifier: string
+            Unique parameter identifier
+
+        Returns
+        -------
+        bool
+        """
+        return identifier in self.children_ids
+
     def has_constant(self):
         """True if the as_constant property is not None.
 
@@ -14,7 +14,8 @@ In addition, helper methods are provided for convenience to create parameter
 declarations from within Python scripts.
 """
 
-from jsonschema import validate, ValidationError
+from jsonschema import ValidationError
+from jsonschema.validators import validator_for
 
 from benchtmpl.error import InvalidParameterError
 
@@ -75,6 +76,12 @@ PARAMETER_SCHEMA = {
 }
 
 
+"""Validator for parameter declarations. The validator is created once for the
+schema instead of for every validated declaration.
+"""
+PARAMETER_VALIDATOR = validator_for(PARAMETER_SCHEMA)(PARAMETER_SCHEMA)
+
+
 # ------------------------------------------------------------------------------
 # Data types for template parameters
 # ------------------------------------------------------------------------------
@@ -265,7 +272,7 @@ def validate_parameter(param_declaration):
     """
     # Make sure that the given package declaration matches the schema
     try:
-        validate(param_declaration, PARAMETER_SCHEMA)
+        PARAMETER_VALIDATOR.validate(param_declaration)
     except ValidationError as ex:
         raise InvalidParameterError('failed to validate parameter declaration. {}'.format(ex.message))
     # Ensure that the given parameter data type is valid
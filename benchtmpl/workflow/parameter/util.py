@@ -9,7 +9,7 @@
 """Helper methods for workflow template parameters."""
 
 
-from benchtmpl.workflow.parameter.base import TemplateParameter
+from benchtmpl.workflow.parameter.base import TemplateParameter, SORT_KEY
 
 import benchtmpl.error as err
 import benchtmpl.workflow.parameter.declaration as pd
@@ -57,13 +57,22 @@ def create_parameter_index(parameters, validate=True):
         result[p_id] = tp
     # Add parameter templates to the list of children for their
     # respective parent (if given). We currently only support one level
-    # of nesting.
+    # of nesting. The children of each parent are collected first and then
+    # assigned as a sorted list (that is stored as a tuple). Only parameters
+    # of type DT_LIST or DT_RECORD can have children.
+    children = dict()
     for para in parameters:
-        if pd.LABEL_PARENT in para:
-            p_id = para[pd.LABEL_ID]
-            parent = para[pd.LABEL_PARENT]
-            if not parent is None:
-                result[parent].add_child(result[p_id])
+        parent = para.get(pd.LABEL_PARENT)
+        if not parent is None:
+            child = result[para[pd.LABEL_ID]]
+            children.setdefault(parent, list()).append(child)
+    for parent, nodes in children.items():
+        para = result[parent]
+        if not (para.is_list() or para.is_record()):
+            raise err.InvalidTemplateError(
+                'parameter \'{}\' cannot have children'.format(parent)
+            )
+        para.children = sort_parameters(nodes)
     return result
 
 
@@ -81,4 +90,4 @@ def sort_parameters(parameters):
     -------
     list(benchtmpl.workflow.parameter.base.TemplateParameter)
     """
-    return sorted(parameters, key=lambda p: (p.index, p.identifier))
+    return sorted(parameters, key=SORT_KEY)
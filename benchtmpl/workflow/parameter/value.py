@@ -17,12 +17,28 @@ from benchtmpl.workflow.parameter.base import ParameterBase
 import benchtmpl.workflow.parameter.declaration as pd
 
 
+"""Mapping of parameter data types to the expected Python type of argument
+values and the type label that is used in error messages.
+"""
+ARGUMENT_TYPES = {
+    pd.DT_BOOL: (bool, 'bool'),
+    pd.DT_DECIMAL: (float, 'float'),
+    pd.DT_FILE: (InputFile, 'input file'),
+    pd.DT_INTEGER: (int, 'int'),
+    pd.DT_LIST: (list, 'list'),
+    pd.DT_RECORD: (dict, 'dictionary'),
+    pd.DT_STRING: (str, 'string')
+}
+
+
 class TemplateArgument(ParameterBase):
     """Template arguments capture user-provided values for workflow template
     parameters that are used to instantiate and execute a parameterized workflow
     specification. The argument class captures the actual value and provides
     access to the parameter meta-data.
     """
+    __slots__ = ('value',)
+
     def __init__(self, parameter, value, validate=True):
         """Initialize the parameter value and meta-data. The type of the value
         argument depends on the data type of the parameter. If the parameter is
@@ -78,35 +94,20 @@ class TemplateArgument(ParameterBase):
         ------
         ValueError
         """
-        if self.is_bool():
-            if not isinstance(self.value, bool):
-                raise ValueError('expected bool for \'{}\''.format(self.identifier))
-        elif self.is_float():
-            if not isinstance(self.value, float):
-                raise ValueError('expected float for \'{}\''.format(self.identifier))
-        elif self.is_int():
-            if not isinstance(self.value, int):
-                raise ValueError('expected int for \'{}\''.format(self.identifier))
-        elif self.is_string():
-            if not isinstance(self.value, str):
-                raise ValueError('expected string for \'{}\''.format(self.identifier))
-        elif self.is_file():
-            # Expects a file handle
-            if not isinstance(self.value, InputFile):
-                raise ValueError('expected input file for \'{}\''.format(self.identifier))
-        elif self.is_list():
-            if not isinstance(self.value, list):
-                raise ValueError('expected list for \'{}\''.format(self.identifier))
+        arg_type = ARGUMENT_TYPES.get(self.data_type)
+        if arg_type is None:
+            raise ValueError('unknown data type \'{}\''.format(self.data_type))
+        value_type, label = arg_type
+        if not isinstance(self.value, value_type):
+            raise ValueError('expected {} for \'{}\''.format(label, self.identifier))
+        # Validate the components of nested lists and records
+        if self.is_list():
             for record in self.value:
                 for arg in record.values():
                     arg.validate()
         elif self.is_record():
-            if not isinstance(self.value, dict):
-                raise ValueError('expected dictionary for \'{}\''.format(self.identifier))
             for arg in self.value.values():
                 arg.validate()
-        else:
-            raise ValueError('unknown data type \'{}\''.format(self.data_type))
 
 
 # ------------------------------------------------------------------------------
@@ -139,7 +140,9 @@ def mandatory_arguments(parameters, parent=None):
 
 def parse_arguments(arguments, parameters, validate=False, parent=None):
     """Convert a dictionary of argument identifier and argument value pairs into
-    a dictionary of template argument instances.
+    a dictionary of template argument instances. Values that already are
+    template arguments for the respective parameter are not parsed again. They
+    are only re-validated if the validate flag is True.
 
     Parameters
     ----------
@@ -156,6 +159,80 @@ def parse_arguments(arguments, parameters, validate=False, parent=None):
     -------
     dict(benchtmpl.workflow.parameter.value.TemplateArgument)
 
+    Raises
+    ------
+    ValueError
+    """
+    return _parse_arguments(
+        arguments=arguments,
+        parameters=parameters,
+        validate=validate,
+        parent=parent,
+        mandatory=mandatory_arguments(parameters, parent=parent)
+    )
+
+
+def parse_arguments_many(arguments, parameters, validate=False):
+    """Convert a list of argument dictionaries for the same set of parameter
+    declarations into a list of dictionaries of template argument instances.
+    The list of mandatory top-level arguments is only computed once for all
+    argument dictionaries.
+
+    Parameters
+    ----------
+    arguments: list(dict)
+        List of dictionaries with key, value pairs of argument identifier and
+        argument value
+    parameters: dict(benchtmpl.workflow.parameter.base.TemplateParameter)
+        Dictionary of parameter declarations
+    validate: bool, optional
+        Validate argument value agains parameter declaration if True
+
+    Returns
+    -------
+    list(dict(benchtmpl.workflow.parameter.value.TemplateArgument))
+
+    Raises
+    ------
+    ValueError
+    """
+    mandatory = mandatory_arguments(parameters)
+    result = list()
+    for args in arguments:
+        result.append(
+            _parse_arguments(
+                arguments=args,
+                parameters=parameters,
+                validate=validate,
+                parent=None,
+                mandatory=mandatory
+            )
+        )
+    return result
+
+
+def _parse_arguments(arguments, parameters, validate, parent, mandatory):
+    """Convert a dictionary of argument identifier and argument value pairs into
+    a dictionary of template argument instances. Implements parse_arguments
+    for a given list of identifier for mandatory arguments.
+
+    Parameters
+    ----------
+    arguments: dict()
+        Key, value pairs of argument identifier and argument value
+    parameters: dict(benchtmpl.workflow.parameter.base.TemplateParameter)
+        Dictionary of parameter declarations
+    validate: bool
+        Validate argument value agains parameter declaration if True
+    parent: benchtmpl.workflow.parameter.base.TemplateParameter
+        Parent paremeter declaration for nested structures
+    mandatory: list(string)
+        Identifier of mandatory arguments
+
+    Returns
+    -------
+    dict(benchtmpl.workflow.parameter.value.TemplateArgument)
+
     Raises
     ------
     ValueError
@@ -167,16 +244,27 @@ def parse_arguments(arguments, parameters, validate=False, parent=None):
         if not arg_id in parameters:
             raise ValueError('unknown argument \'{}\''.format(arg_id))
         para = parameters[arg_id]
-        if isinstance(arg_value, list) and para.is_list():
-            # Expects a list of records
+        if isinstance(arg_value, TemplateArgument):
+            # Re-use previously parsed arguments
+            if arg_value.identifier != para.identifier or arg_value.data_type != para.data_type:
+                raise ValueError('invalid value for \'{}\''.format(arg_id))
+            if validate:
+                arg_value.validate()
+            result[arg_id] = arg_value
+            continue
+        elif isinstance(arg_value, list) and para.is_list():
+            # Expects a list of records. The mandatory arguments are the same
+            # for all records in the list.
+            rec_mandatory = mandatory_arguments(parameters, parent=para)
             value = list()
             for rec in arg_value:
                 value.append(
-                    parse_arguments(
+                    _parse_arguments(
                         arguments=rec,
                         parameters=parameters,
                         validate=validate,
-                        parent=para
+                        parent=para,
+                        mandatory=rec_mandatory
                     )
                 )
         elif isinstance(arg_value, dict) and para.is_record():
@@ -197,7 +285,7 @@ def parse_arguments(arguments, parameters, validate=False, parent=None):
             validate=validate
         )
     # Ensure that all mandatory arguments are given
-    for key in mandatory_arguments(parameters, parent=parent):
+    for key in mandatory:
         if not key in result:
             raise ValueError('missing value for \'{}\''.format(key))
     return result
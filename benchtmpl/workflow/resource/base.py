@@ -33,6 +33,10 @@ LABEL_FILEPATH = 'filepath'
 LABEL_ID = 'id'
 LABEL_TYPE = 'type'
 
+"""Sets of mandatory element labels for descriptor serializations."""
+DESCRIPTOR_LABELS = frozenset([LABEL_ID, LABEL_TYPE])
+FILE_RESOURCE_LABELS = frozenset([LABEL_FILEPATH, LABEL_ID, LABEL_TYPE])
+
 
 class ResourceDescriptor(object):
     """Each resource handle has an identifier that is unique among the resources
@@ -77,9 +81,10 @@ class ResourceDescriptor(object):
         ------
         benchtmpl.error.InvalidTemplateError
         """
-        if not (LABEL_ID in doc and LABEL_TYPE in doc):
+        if not DESCRIPTOR_LABELS.issubset(doc):
             raise InvalidTemplateError('invalid resource descriptor serialization')
-        if doc[LABEL_TYPE] == RESOURCE_FILE:
+        type_id = doc[LABEL_TYPE]
+        if type_id == RESOURCE_FILE:
             return FileResource.from_dict(doc)
         else:
             raise ValueError('unknown resource type \'{}\''.format(type_id))
@@ -140,10 +145,8 @@ class FileResource(ResourceDescriptor):
         ------
         ValueError
         """
-        # Expect exactly three elements in the dictionary
-        if len(doc) != 3:
-            raise ValueError('invalid file resource descriptor')
-        if not (LABEL_ID in doc and LABEL_TYPE in doc and LABEL_FILEPATH in doc):
+        # Expect exactly the three file resource elements in the dictionary
+        if FILE_RESOURCE_LABELS.symmetric_difference(doc):
             raise ValueError('invalid file resource descriptor')
         if doc[LABEL_TYPE] != RESOURCE_FILE:
             raise ValueError('invalid file resource descriptor')
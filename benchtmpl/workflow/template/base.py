@@ -26,6 +26,22 @@ import benchtmpl.util.core as util
 import benchtmpl.workflow.parameter.util as para
 
 
+"""Prefix and suffix of template parameter references in workflow
+specifications.
+"""
+REF_PREFIX = '$[['
+REF_SUFFIX = ']]'
+
+
+"""String types in workflow specifications. The JSON parser returns unicode
+strings on Python 2.
+"""
+try:
+    STRING_TYPES = basestring  # noqa: F821
+except NameError:
+    STRING_TYPES = str
+
+
 class TemplateHandle(object):
     """The workflow template contains a dictionary of template parameter
     declarations. Parameter declarations are keyed by their unique identifier
@@ -34,6 +50,11 @@ class TemplateHandle(object):
     Each template has a unique identifier and an optional base directory that
     contains input files for the represented workflow.
     """
+    __slots__ = (
+        'workflow_spec', 'identifier', 'base_dir', 'parameters',
+        '_sorted_parameters'
+    )
+
     def __init__(self, workflow_spec, identifier=None, base_dir=None, parameters=None):
         """Initialize the components of the workflow template. A ValueError is
         raised if the identifier of template parameters are not unique.
@@ -69,6 +90,9 @@ class TemplateHandle(object):
                 if para.identifier in self.parameters:
                     raise err.InvalidTemplateError('parameter \'{}\' not unique'.format(para.identifier))
                 self.parameters[para.identifier] = para
+        # Sorted list of parameter declarations. The list is created on first
+        # access by list_parameters().
+        self._sorted_parameters = None
 
     def get_parameter(self, identifier):
         """Short-cut to access the declaration for a parameter with the given
@@ -90,11 +114,17 @@ class TemplateHandle(object):
         their index value. Ties are broken using the unique parameter
         identifier.
 
+        The parameter declarations are only sorted once. The parameter index
+        of the template is not expected to change after the template has been
+        created. Each call returns a new list object.
+
         Returns
         -------
         list(benchtmpl.workflow.parameter.base.TemplateParameter)
         """
-        return para.sort_parameters(self.parameters.values())
+        if self._sorted_parameters is None:
+            self._sorted_parameters = para.sort_parameters(self.parameters.values())
+        return list(self._sorted_parameters)
 
     def validate_arguments(self, arguments):
         """Ensure that the workflow can be instantiated using the given set of
@@ -155,34 +185,34 @@ def get_parameter_references(spec, parameters=None):
     ------
     benchtmpl.error.InvalidTemplateError
     """
-    # The new object will contain the modified workflow specification
     if parameters is None:
         parameters = set()
-    for key in spec:
-        val = spec[key]
-        if isinstance(val, str):
-            # If the value is of type string we test whether the string is a
-            # reference to a template parameter
-            if is_parameter(val):
-                # Extract variable name.
-                parameters.add(get_parameter_name(val))
-        elif isinstance(val, dict):
-            # Recursive call to get_parameter_references
-            get_parameter_references(val, parameters=parameters)
-        elif isinstance(val, list):
-            for list_val in val:
-                if isinstance(list_val, str):
-                    # Get potential references to template parameters in
-                    # list elements of type string.
-                    if is_parameter(list_val):
-                        # Extract variable name.
-                        parameters.add(get_parameter_name(list_val))
-                elif isinstance(list_val, dict):
-                    # Recursive replace for dictionaries
-                    get_parameter_references(list_val, parameters=parameters)
-                elif isinstance(list_val, list):
+    # Walk the specification using an explicit stack of dictionaries and
+    # lists. Workflow specifications that are loaded from YAML files may
+    # reference the same object (anchors and aliases) multiple times. Keep
+    # track of visited objects to process each of them only once.
+    stack = [spec]
+    visited = set([id(spec)])
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            values = node.values()
+        else:
+            values = node
+        for val in values:
+            if isinstance(val, STRING_TYPES):
+                # If the value is of type string we test whether the string
+                # is a reference to a template parameter
+                if is_parameter(val):
+                    # Extract variable name.
+                    parameters.add(get_parameter_name(val))
+            elif isinstance(val, (dict, list)):
+                if isinstance(val, list) and isinstance(node, list):
                     # We currently do not support lists of lists
                     raise err.InvalidTemplateError('nested lists not supported')
+                if not id(val) in visited:
+                    visited.add(id(val))
+                    stack.append(val)
     return parameters
 
 
@@ -199,7 +229,7 @@ def is_parameter(value):
     bool
     """
     # Check if the value matches the template parameter reference pattern
-    return value.startswith('$[[') and value.endswith(']]')
+    return value.startswith(REF_PREFIX) and value.endswith(REF_SUFFIX)
 
 
 def replace_args(spec, arguments, parameters):
@@ -228,23 +258,61 @@ def replace_args(spec, arguments, parameters):
     ------
     benchtmpl.error.InvalidTemplateError
     """
-    if isinstance(spec, dict):
-        # The new object will contain the modified workflow specification
-        obj = dict()
-        for key in spec:
-            obj[key] = replace_args(spec[key], arguments, parameters)
-    elif isinstance(spec, list):
-        obj = list()
-        for val in spec:
-            if isinstance(val, list):
-                # We currently do not support lists of lists
-                raise err.InvalidTemplateError('nested lists not supported')
-            obj.append(replace_args(val, arguments, parameters))
-    elif isinstance(spec, str) or isinstance(spec, basestring):
-        obj = replace_value(spec, arguments, parameters)
-    else:
-        obj = spec
-    return obj
+    if not isinstance(spec, (dict, list)):
+        return _replace_scalar(spec, arguments, parameters)
+    # Walk the specification using an explicit stack of pairs of original
+    # dictionaries or lists and their modified copies. The copies are added to
+    # their parent when they are created and filled when they are taken from
+    # the stack. The memo dictionary maps the identifier of objects in the
+    # original specification to their copies. Objects that are referenced
+    # multiple times in the specification are only processed once.
+    result = dict() if isinstance(spec, dict) else list()
+    memo = {id(spec): result}
+    stack = [(spec, result)]
+    while stack:
+        src, dst = stack.pop()
+        is_dict = isinstance(src, dict)
+        for key, val in (src.items() if is_dict else enumerate(src)):
+            if isinstance(val, (dict, list)):
+                if not is_dict and isinstance(val, list):
+                    # We currently do not support lists of lists
+                    raise err.InvalidTemplateError('nested lists not supported')
+                obj = memo.get(id(val))
+                if obj is None:
+                    obj = dict() if isinstance(val, dict) else list()
+                    memo[id(val)] = obj
+                    stack.append((val, obj))
+            else:
+                obj = _replace_scalar(val, arguments, parameters)
+            if is_dict:
+                dst[key] = obj
+            else:
+                dst.append(obj)
+    return result
+
+
+def _replace_scalar(value, arguments, parameters):
+    """Replace a scalar value in a workflow specification. Only strings that
+    start with the reference prefix can be references to template parameters.
+    All other values are returned as they are.
+
+    Parameters
+    ----------
+    value: any
+        Scalar value in the workflow specification
+    arguments: dict(benchtmpl.workflow.parameter.value.TemplateArgument)
+        Dictionary that associates template parameter identifiers with
+        argument values
+    parameters: dict(benchtmpl.workflow.parameter.base.TemplateParameter)
+        Dictionary of parameter declarations
+
+    Returns
+    -------
+    any
+    """
+    if isinstance(value, STRING_TYPES) and value.startswith(REF_PREFIX):
+        return replace_value(value, arguments, parameters)
+    return value
 
 
 def replace_value(value, arguments, parameters):
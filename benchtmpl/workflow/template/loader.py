@@ -17,6 +17,10 @@ module.
 """
 
 from abc import abstractmethod
+from collections import OrderedDict
+
+import copy
+import os
 
 from benchtmpl.workflow.parameter.base import TemplateParameter
 
@@ -33,6 +37,16 @@ LABEL_PARAMETERS = 'parameters'
 LABEL_WORKFLOW = 'workflow'
 
 
+"""Maximum number of parsed YAML documents that are kept in the parse cache."""
+PARSE_CACHE_SIZE = 64
+
+"""Cache for parsed YAML template files. Maps the real path of a file to the
+file version (device, inode, modification time, and size) and the parsed
+document. Entries are replaced when the file is modified.
+"""
+_PARSE_CACHE = OrderedDict()
+
+
 class TemplateLoader(object):
     """The template loader is used by the template repository to store and
     retrieve workflow template specifications on disk.
@@ -108,7 +122,7 @@ class TemplateLoader(object):
         ------
         benchtmpl.error.InvalidTemplateError
         """
-        doc = util.read_object(filename, format=format)
+        doc = read_template_file(filename, format=format)
         return self.from_dict(
             doc,
             identifier=identifier,
@@ -232,3 +246,66 @@ class DefaultTemplateLoader(TemplateLoader):
             LABEL_WORKFLOW: template.workflow_spec,
             LABEL_PARAMETERS: [p.to_dict() for p in template.parameters.values()]
         }
+
+
+# ------------------------------------------------------------------------------
+# Helper Methods
+# ------------------------------------------------------------------------------
+
+def clear_parse_cache(directory):
+    """Remove cached documents for all files in the given directory and its
+    sub-folders from the parse cache. Used when a directory is deleted since
+    files that are later created at the same path may not be detected as
+    modified.
+
+    Parameters
+    ----------
+    directory: string
+        Path to a directory on disk
+    """
+    prefix = os.path.join(os.path.realpath(directory), '')
+    for key in [k for k in _PARSE_CACHE if k.startswith(prefix)]:
+        del _PARSE_CACHE[key]
+
+
+def read_template_file(filename, format=None):
+    """Read the dictionary serialization of a template from file. Parsing YAML
+    files is expensive. Parsed YAML documents are therefore kept in a cache
+    that is keyed by the real path of the file. A cache entry is only used if
+    the device, inode, modification time, and size of the file have not
+    changed. Callers
+    receive a copy of the cached document that they are free to modify.
+
+    JSON files are always read from disk since parsing them is cheaper than
+    copying the cached document.
+
+    Parameters
+    ----------
+    filename: string
+        Path to a file on disk
+    format: string, optional
+        Optional file format identifier. The default is YAML
+
+    Returns
+    -------
+    dict
+
+    Raises
+    ------
+    ValueError
+    """
+    format = util.get_format(filename, format=format)
+    if format != util.FORMAT_YAML:
+        return util.read_object(filename, format=format)
+    key = os.path.realpath(filename)
+    version = util.get_file_version(key)
+    entry = _PARSE_CACHE.get(key)
+    if entry is None or entry[0] != version:
+        doc = util.read_object(filename, format=format)
+        _PARSE_CACHE[key] = (version, doc)
+        # Remove the oldest entries if the cache exceeds its maximum size
+        while len(_PARSE_CACHE) > PARSE_CACHE_SIZE:
+            _PARSE_CACHE.popitem(last=False)
+    else:
+        doc = entry[1]
+    return copy.deepcopy(doc)
@@ -19,6 +19,7 @@ import shutil
 
 from benchtmpl.workflow.template.base import TemplateHandle
 from benchtmpl.workflow.template.loader import DefaultTemplateLoader
+from benchtmpl.workflow.template.loader import clear_parse_cache
 
 import benchtmpl.error as err
 import benchtmpl.util.core as util
@@ -45,7 +46,7 @@ class TemplateRepository(object):
     """
     def __init__(
         self, base_dir,  loader=None, filenames=None, suffixes=None,
-        id_func=None, max_attempts=DEFAULT_MAX_ATTEMPTS
+        id_func=None, max_attempts=DEFAULT_MAX_ATTEMPTS, link_files=False
     ):
         """Initialize the base directory where templates are maintained. The
         optional identifier function is used to generate unique template
@@ -69,6 +70,12 @@ class TemplateRepository(object):
         max_attempts: int, optional
             Maximum number of attempts to create a unique folder for a new
             workflow template
+        link_files: bool, optional
+            Create hard links to the files in a template source directory
+            instead of copying them. Files are copied if linking fails, e.g.,
+            if the source directory is on a different file system. Only set
+            this flag if source files are not modified after a template has
+            been added.
         """
         self.base_dir = os.path.abspath(base_dir)
         self.loader = loader if not loader is None else DefaultTemplateLoader()
@@ -76,6 +83,7 @@ class TemplateRepository(object):
         self.suffixes = suffixes if not suffixes is None else ['.yml', '.yaml', '.json']
         self.id_func = id_func if not id_func is None else util.get_short_identifier
         self.max_attempts = max_attempts
+        self.link_files = link_files
         # Create the base directory if it does not exist
         util.create_dir(self.base_dir)
 
@@ -125,14 +133,17 @@ class TemplateRepository(object):
             raise ValueError('both \'src_dir\' and \'src_repo_url\' are missing')
         elif not src_dir is None and not src_repo_url is None:
             raise ValueError('cannot have both \'src_dir\' and \'src_repo_url\'')
-        # Create a new unique folder for the template resources
+        # Create a new unique folder for the template resources. Read the
+        # names of existing folders once instead of testing each generated
+        # identifier against the file system.
+        existing = set(os.listdir(self.base_dir))
         identifier = None
         template_dir = None
         attempt = 0
         while identifier is None or template_dir is None:
             identifier = self.id_func()
             template_dir = os.path.join(self.base_dir, identifier)
-            if os.path.isdir(template_dir):
+            if identifier in existing:
                 identifier = None
                 template_dir = None
                 attempt += 1
@@ -145,7 +156,11 @@ class TemplateRepository(object):
             # folder or clone the Git repository.
             static_dir = os.path.join(template_dir, STATIC_FILES_DIR)
             if not src_dir is None:
-                shutil.copytree(src=src_dir, dst=static_dir)
+                copy_files(
+                    src_dir=src_dir,
+                    dst_dir=static_dir,
+                    link_files=self.link_files
+                )
             else:
                 git.Repo.clone_from(src_repo_url, static_dir)
             # Find template specification file in the template workflow folder.
@@ -176,9 +191,11 @@ class TemplateRepository(object):
         except (IOError, OSError, ValueError, err.TemplateError) as ex:
             # Make sure to cleanup by removing the created template folder
             shutil.rmtree(template_dir)
+            clear_parse_cache(template_dir)
             raise err.InvalidTemplateError(str(ex))
         # No template file found. Cleanup and raise error
         shutil.rmtree(template_dir)
+        clear_parse_cache(template_dir)
         raise err.InvalidTemplateError('no template file found')
 
     def delete_template(self, identifier):
@@ -206,6 +223,7 @@ class TemplateRepository(object):
         template_dir = os.path.join(self.base_dir, identifier)
         if os.path.isdir(template_dir):
             shutil.rmtree(template_dir)
+            clear_parse_cache(template_dir)
             return True
         return False
 
@@ -234,3 +252,39 @@ class TemplateRepository(object):
             filename=os.path.join(template_dir, TEMPLATE_FILE),
             base_dir=os.path.join(template_dir, STATIC_FILES_DIR)
         )
+
+
+# ------------------------------------------------------------------------------
+# Helper Methods
+# ------------------------------------------------------------------------------
+
+def copy_files(src_dir, dst_dir, link_files=False):
+    """Copy the files and folders in the source directory to the destination
+    directory. The destination directory must not exist. If the link_files
+    flag is True hard links to the source files are created instead of file
+    copies. If creating the links fails (e.g., because the destination is on a
+    different file system or on Python 2) the files are copied instead.
+
+    Parameters
+    ----------
+    src_dir: string
+        Path to source directory
+    dst_dir: string
+        Path to destination directory
+    link_files: bool, optional
+        Create hard links instead of file copies if True
+
+    Raises
+    ------
+    IOError
+    OSError
+    """
+    if link_files:
+        try:
+            shutil.copytree(src=src_dir, dst=dst_dir, copy_function=os.link)
+            return
+        except (OSError, shutil.Error, TypeError):
+            # Remove partial results before copying the files. The TypeError
+            # is raised on Python 2 where copytree() has no copy_function.
+            shutil.rmtree(dst_dir, ignore_errors=True)
+    shutil.copytree(src=src_dir, dst=dst_dir)
@@ -64,7 +64,6 @@ class TestScanner(object):
         sc = Scanner(reader=ListReader(5 * ['']))
         assert sc.next_int(default_value=11) == 11
         assert sc.next_float(default_value=1.23) == 1.23
-        #self.assertFalse(sc.next_bool(default_value=False))
         assert not sc.next_bool(default_value=False)
         assert sc.next_file(default_value='file.txt') == 'file.txt'
         assert sc.next_string(default_value='Default text') == 'Default text'
@@ -78,8 +77,11 @@ class TestScanner(object):
         assert sc.next_bool()
         assert sc.next_file() == 'data/names.txt'
         assert sc.next_string() == 'Some text'
-        # Value errors when parsing invalid tokens
-        sc = Scanner(reader=ListReader(['3', 'FALSE', 'data/names.txt']))
+        # Read tokens beyond the end of the list
+        assert sc.next_string() is None
+        # Value errors when parsing invalid tokens. Re-use the scanner after
+        # resetting the token list of the reader.
+        sc.reader.reset(['3', 'FALSE', 'data/names.txt'])
         with pytest.raises(ValueError):
             sc.next_bool()
         with pytest.raises(ValueError):
@@ -0,0 +1,56 @@
+"""Test helper methods in the util module."""
+
+import datetime
+import math
+import os
+import pytest
+
+import benchtmpl.util.core as util
+
+
+class TestUtil(object):
+    """Test helper methods for reading and writing files."""
+    def test_get_format(self):
+        """Test guessing the data format from file suffixes."""
+        assert util.get_format('template.json') == util.FORMAT_JSON
+        assert util.get_format('template.yaml') == util.FORMAT_YAML
+        assert util.get_format('template.yml') == util.FORMAT_YAML
+        assert util.get_format('template') == util.FORMAT_YAML
+        # A given format overrides the file suffix
+        assert util.get_format('template.json', format='yaml') == util.FORMAT_YAML
+
+    def test_non_string_keys(self, tmpdir):
+        """Test writing JSON objects that have non-string keys."""
+        filename = os.path.join(str(tmpdir), 'doc.json')
+        util.write_object(filename=filename, obj={1: 'A', 'B': {2: 'C'}})
+        doc = util.read_object(filename=filename)
+        assert doc == {'1': 'A', 'B': {'2': 'C'}}
+
+    def test_json_round_trip(self, tmpdir):
+        """Test reading JSON objects with values that are not supported by all
+        JSON parsers.
+        """
+        filename = os.path.join(str(tmpdir), 'doc.json')
+        util.write_object(filename=filename, obj={'A': 2 ** 70, 'B': float('nan')})
+        doc = util.read_object(filename=filename)
+        assert doc['A'] == 2 ** 70
+        assert math.isnan(doc['B'])
+
+    def test_to_datetime(self):
+        """Test converting timestamps in ISO format to datetime objects."""
+        ts = datetime.datetime(2019, 7, 1, 10, 11, 12, 131415)
+        assert util.to_datetime(ts.isoformat()) == ts
+        ts = datetime.datetime(2019, 7, 1, 10, 11, 12)
+        assert util.to_datetime(ts.isoformat()) == ts
+        # Timestamps with less than six digits for microseconds
+        ts = datetime.datetime(2019, 7, 1, 10, 11, 12, 100000)
+        assert util.to_datetime('2019-07-01T10:11:12.1') == ts
+        # Error for timestamps with time zone and for other ISO formats
+        for timestamp in [
+            '2019-07-01T10:11:12+02:00',
+            '2019-07-01T10:11:12Z',
+            '2019-07-01',
+            '20190701T101112'
+        ]:
+            with pytest.raises(ValueError):
+                util.to_datetime(timestamp)
@@ -0,0 +1,22 @@
+"""Shared fixtures for the benchmark template tests."""
+
+import os
+import pytest
+
+from benchtmpl.workflow.benchmark.loader import BenchmarkTemplateLoader
+
+
+DIR = os.path.dirname(str(os.path.realpath(__file__)))
+TEMPLATE_FILE_1 = os.path.join(DIR, '../../.files/benchmark/template_1.yaml')
+
+
+@pytest.fixture(scope='session')
+def benchmark_loader():
+    """Template loader for benchmark templates that is shared by all tests."""
+    return BenchmarkTemplateLoader()
+
+
+@pytest.fixture(scope='session')
+def loaded_template_1(benchmark_loader):
+    """Benchmark template that is loaded once from the valid template file."""
+    return benchmark_loader.load(TEMPLATE_FILE_1)
@@ -1,5 +1,6 @@
 """Test benchmark result schema objects."""
 
+import json
 import pytest
 
 import benchtmpl.workflow.benchmark.schema as schema
@@ -19,16 +20,21 @@ class TestBenchmarkResultSchema(object):
         assert col.identifier == 'col_1'
         assert col.name == 'Column 1'
         assert col.data_type == pd.DT_INTEGER
-        assert col.required
-        assert type(col.required) == bool
+        assert col.required is True
         assert not col.is_default
         assert col.is_desc()
-        col = schema.BenchmarkResultColumn.from_dict(col.to_dict())
+        assert col.to_dict() == schema.column_declaration(
+            identifier='col_1',
+            name='Column 1',
+            data_type=pd.DT_INTEGER
+        )
+        col = schema.BenchmarkResultColumn.from_dict(
+            json.loads(json.dumps(col.to_dict()))
+        )
         assert col.identifier == 'col_1'
         assert col.name == 'Column 1'
         assert col.data_type == pd.DT_INTEGER
-        assert col.required
-        assert type(col.required) == bool
+        assert col.required is True
         assert not col.is_default
         assert col.is_desc()
         # Test serialization if required value is given
@@ -43,16 +49,16 @@ class TestBenchmarkResultSchema(object):
         assert col.identifier == 'col_1'
         assert col.name == 'Column 1'
         assert col.data_type == pd.DT_INTEGER
-        assert not col.required
-        assert type(col.required) == bool
+        assert col.required is False
         assert col.is_default
         assert not col.is_desc()
-        col = schema.BenchmarkResultColumn.from_dict(col.to_dict())
+        col = schema.BenchmarkResultColumn.from_dict(
+            json.loads(json.dumps(col.to_dict()))
+        )
         assert col.identifier == 'col_1'
         assert col.name == 'Column 1'
         assert col.data_type == pd.DT_INTEGER
-        assert not col.required
-        assert type(col.required) == bool
+        assert col.required is False
         assert col.is_default
         assert not col.is_desc()
 
@@ -61,28 +67,30 @@ class TestBenchmarkResultSchema(object):
         s = schema.BenchmarkResultSchema.from_dict({
             schema.LABEL_RESULT_FILE: 'results.json',
             schema.LABEL_SCHEMA: [
-                schema.BenchmarkResultColumn(
+                schema.column_declaration(
                     identifier='col_1',
                     name='Column 1',
                     data_type=pd.DT_INTEGER
-                ).to_dict(),
-                schema.BenchmarkResultColumn(
+                ),
+                schema.column_declaration(
                     identifier='col_2',
                     name='Column 2',
                     data_type=pd.DT_DECIMAL,
                     required=True
-                ).to_dict(),
-                schema.BenchmarkResultColumn(
+                ),
+                schema.column_declaration(
                     identifier='col_3',
                     name='Column 3',
                     data_type=pd.DT_STRING,
                     required=False
-                ).to_dict()
+                )
             ]
         })
         self.validate_schema(s)
-        # Recreate the object from its serialization
-        s = schema.BenchmarkResultSchema.from_dict(s.to_dict())
+        # Recreate the object from its JSON serialization
+        s = schema.BenchmarkResultSchema.from_dict(
+            json.loads(json.dumps(s.to_dict()))
+        )
         self.validate_schema(s)
         # Error cases
         with pytest.raises(ValueError):
@@ -99,6 +107,12 @@ class TestBenchmarkResultSchema(object):
                 name='Column 1',
                 data_type=pd.DT_LIST
             )
+        with pytest.raises(ValueError):
+            schema.column_declaration(
+                identifier='col_1',
+                name='Column 1',
+                data_type=pd.DT_LIST
+            )
 
     def validate_column(self, column, identifier, name, data_type, required):
         """Ensure that the given column matches the respective arguments."""
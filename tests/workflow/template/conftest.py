@@ -0,0 +1,88 @@
+"""Shared fixtures for the workflow template tests."""
+
+import os
+import pytest
+
+from benchtmpl.io.files.base import FileHandle
+from benchtmpl.workflow.parameter.base import TemplateParameter
+from benchtmpl.workflow.parameter.value import TemplateArgument
+from benchtmpl.workflow.template.base import TemplateHandle
+from benchtmpl.workflow.template.loader import DefaultTemplateLoader
+
+import benchtmpl.workflow.parameter.declaration as pd
+import benchtmpl.workflow.template.loader as tmpl
+
+
+DIR = os.path.dirname(os.path.realpath(__file__))
+TEMPLATE_JSON_FILE = os.path.join(DIR, '../../.files/template/template.json')
+TEMPLATE_YAML_FILE = os.path.join(DIR, '../../.files/template/template.yaml')
+
+
+@pytest.fixture(scope='session')
+def template_loader():
+    """Default template loader that is shared by all tests."""
+    return DefaultTemplateLoader()
+
+
+@pytest.fixture(scope='session', params=[TEMPLATE_YAML_FILE, TEMPLATE_JSON_FILE])
+def spec_template(request, template_loader):
+    """Template that is loaded once per session from the YAML and the JSON
+    template specification file, respectively. Tests must not modify the
+    template.
+    """
+    return template_loader.load(request.param)
+
+
+@pytest.fixture(scope='session')
+def spec_arguments(spec_template):
+    """Arguments for the code, names, and sleeptime parameters of the spec
+    template.
+    """
+    return {
+        'code': TemplateArgument(
+            parameter=spec_template.get_parameter('code'),
+            value=FileHandle('code/helloworld.py')
+        ),
+        'names': TemplateArgument(
+            parameter=spec_template.get_parameter('names'),
+            value=FileHandle('data/list-of-names.txt')
+        ),
+        'sleeptime': TemplateArgument(
+            parameter=spec_template.get_parameter('sleeptime'),
+            value=10
+        )
+    }
+
+
+@pytest.fixture(scope='module')
+def flat_template():
+    """Template with a flat (un-nested) list of parameter declarations."""
+    return TemplateHandle(
+        workflow_spec=dict(),
+        parameters=[
+            TemplateParameter(pd.parameter_declaration('A', data_type=pd.DT_INTEGER)),
+            TemplateParameter(pd.parameter_declaration('B', data_type=pd.DT_BOOL)),
+            TemplateParameter(pd.parameter_declaration('C', data_type=pd.DT_DECIMAL)),
+            TemplateParameter(pd.parameter_declaration('D', data_type=pd.DT_FILE, required=False)),
+            TemplateParameter(pd.parameter_declaration('E', data_type=pd.DT_STRING, required=False))
+        ]
+    )
+
+
+@pytest.fixture(scope='module')
+def nested_template(template_loader):
+    """Template with nested record and list parameter declarations."""
+    return template_loader.from_dict({
+            tmpl.LABEL_WORKFLOW: dict(),
+            tmpl.LABEL_PARAMETERS: [
+                pd.parameter_declaration('A', data_type=pd.DT_INTEGER),
+                pd.parameter_declaration('B', data_type=pd.DT_RECORD),
+                pd.parameter_declaration('C', data_type=pd.DT_DECIMAL, parent='B'),
+                pd.parameter_declaration('D', data_type=pd.DT_STRING, parent='B', required=False),
+                pd.parameter_declaration('E', data_type=pd.DT_LIST, required=False),
+                pd.parameter_declaration('F', data_type=pd.DT_INTEGER, parent='E'),
+                pd.parameter_declaration('G', data_type=pd.DT_DECIMAL,  parent='E', required=False)
+            ]
+        },
+        validate=True
+    )
@@ -5,101 +5,98 @@ import pytest
 
 from benchtmpl.io.files.base import FileHandle, InputFile
 from benchtmpl.workflow.parameter.base import TemplateParameter
-from benchtmpl.workflow.template.base import TemplateHandle
-from benchtmpl.workflow.template.loader import DefaultTemplateLoader
 
 import benchtmpl.workflow.parameter.declaration as pd
 import benchtmpl.workflow.parameter.value as values
-import benchtmpl.workflow.template.loader as tmpl
 
 
 DIR = os.path.dirname(os.path.realpath(__file__))
 LOCAL_FILE = os.path.join(DIR, '../../.files/schema.json')
+INPUT_FILE = InputFile(f_handle=FileHandle(filepath=LOCAL_FILE))
+# Valid arguments for the flat template. Tests create modified copies of the
+# dictionary.
+ARGUMENTS = {'A': 10, 'B': True, 'C': 12.3, 'D': INPUT_FILE, 'E': 'ABC'}
 
 
 class TestArgumentValues(object):
     """Test parsing and validating argument values for parameterized workflow
     templates.
     """
-    def test_flat_parse(self):
+    def test_flat_parse(self, flat_template):
         """Test parsing arguments for a flat (un-nested) parameter declaration.
         """
-        template = TemplateHandle(
-            workflow_spec=dict(),
-            parameters=[
-                TemplateParameter(pd.parameter_declaration('A', data_type=pd.DT_INTEGER)),
-                TemplateParameter(pd.parameter_declaration('B', data_type=pd.DT_BOOL)),
-                TemplateParameter(pd.parameter_declaration('C', data_type=pd.DT_DECIMAL)),
-                TemplateParameter(pd.parameter_declaration('D', data_type=pd.DT_FILE, required=False)),
-                TemplateParameter(pd.parameter_declaration('E', data_type=pd.DT_STRING, required=False))
-            ]
-        )
-        params = template.parameters
-        fh = InputFile(f_handle=FileHandle(filepath=LOCAL_FILE))
+        params = flat_template.parameters
         # Valid argument set
         args = values.parse_arguments(
-            arguments={'A': 10, 'B': True, 'C': 12.5, 'D': fh, 'E': 'ABC'},
+            arguments=ARGUMENTS,
             parameters=params,
             validate=True
         )
         assert len(args) == 5
+        assert set(params) <= set(args)
+        # Previously parsed arguments are returned as they are
+        parsed_args = values.parse_arguments(
+            arguments=args,
+            parameters=params,
+            validate=False
+        )
         for key in params.keys():
-            assert key in args
-        values.parse_arguments(arguments=args, parameters=params, validate=False)
-        # Error cases
-        with pytest.raises(ValueError):
-            values.parse_arguments(arguments={'A': 10, 'Z': 0}, parameters=params)
-        with pytest.raises(ValueError):
-            values.parse_arguments(arguments={'A': 10, 'B': True}, parameters=params)
-        # Validate data type
-        with pytest.raises(ValueError):
-            values.parse_arguments(
-                arguments={'A': '10', 'B': True, 'C': 12.3, 'D': fh, 'E': 'ABC'},
-                parameters=params,
-                validate=True
-            )
+            assert parsed_args[key] is args[key]
         with pytest.raises(ValueError):
             values.parse_arguments(
-                arguments={'A': 10, 'B': 23, 'C': 12.3, 'D': fh, 'E': 'ABC'},
-                parameters=params,
-                validate=True
+                arguments={'A': args['B'], 'B': args['B'], 'C': args['C']},
+                parameters=params
             )
+
+    @pytest.mark.parametrize(
+        'arguments',
+        [{'A': 10, 'Z': 0}, {'A': 10, 'B': True}]
+    )
+    def test_flat_parse_incomplete(self, flat_template, arguments):
+        """Test error cases for unknown and missing arguments."""
         with pytest.raises(ValueError):
             values.parse_arguments(
-                arguments={'A': 10, 'B': True, 'C': '12.3', 'D': fh, 'E': 'ABC'},
-                parameters=params,
-                validate=True
+                arguments=arguments,
+                parameters=flat_template.parameters
             )
+
+    @pytest.mark.parametrize(
+        'key,value',
+        [('A', '10'), ('B', 23), ('C', '12.3'), ('D', 'fh'), ('E', 12)]
+    )
+    def test_flat_parse_invalid(self, flat_template, key, value):
+        """Test error cases for argument values that do not match the data
+        type of the parameter declaration.
+        """
         with pytest.raises(ValueError):
             values.parse_arguments(
-                arguments={'A': 10, 'B': True, 'C': 12.3, 'D': 'fh', 'E': 'ABC'},
-                parameters=params,
+                arguments=dict(ARGUMENTS, **{key: value}),
+                parameters=flat_template.parameters,
                 validate=True
             )
+
+    def test_parse_many(self, flat_template):
+        """Test parsing a list of argument sets for the same template."""
+        params = flat_template.parameters
+        args = values.parse_arguments_many(
+            arguments=[ARGUMENTS, dict(ARGUMENTS, A=11), {'A': 1, 'B': False, 'C': 1.2}],
+            parameters=params,
+            validate=True
+        )
+        assert len(args) == 3
+        assert args[0]['A'].value == 10
+        assert args[1]['A'].value == 11
+        assert len(args[2]) == 3
+        # Error if one of the argument sets is incomplete
         with pytest.raises(ValueError):
-            values.parse_arguments(
-                arguments={'A': 10, 'B': True, 'C': 12.3, 'D': fh, 'E': 12},
-                parameters=params,
-                validate=True
+            values.parse_arguments_many(
+                arguments=[ARGUMENTS, {'A': 10, 'B': True}],
+                parameters=params
             )
 
-    def test_nested_parse(self):
+    def test_nested_parse(self, nested_template):
         """Test parsing arguments for a nested parameter declaration."""
-        template = DefaultTemplateLoader().from_dict({
-                tmpl.LABEL_WORKFLOW: dict(),
-                tmpl.LABEL_PARAMETERS: [
-                    pd.parameter_declaration('A', data_type=pd.DT_INTEGER),
-                    pd.parameter_declaration('B', data_type=pd.DT_RECORD),
-                    pd.parameter_declaration('C', data_type=pd.DT_DECIMAL, parent='B'),
-                    pd.parameter_declaration('D', data_type=pd.DT_STRING, parent='B', required=False),
-                    pd.parameter_declaration('E', data_type=pd.DT_LIST, required=False),
-                    pd.parameter_declaration('F', data_type=pd.DT_INTEGER, parent='E'),
-                    pd.parameter_declaration('G', data_type=pd.DT_DECIMAL,  parent='E', required=False)
-                ]
-            },
-            validate=True
-        )
-        params = template.parameters
+        params = nested_template.parameters
         # Without values for list parameters
         args = values.parse_arguments(
             arguments={'A': 10, 'B': {'C': 12.3}},
@@ -142,6 +139,13 @@ class TestArgumentValues(object):
                 parameters=params,
                 validate=True
             )
+        # Missing value for a mandatory argument when a list argument is given
+        with pytest.raises(ValueError):
+            values.parse_arguments(
+                arguments={'B': {'C': 1.2}, 'E': [{'F': 1}]},
+                parameters=params,
+                validate=True
+            )
 
     def test_validate(self):
         """Test error cases for argument validation."""
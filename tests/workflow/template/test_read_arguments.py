@@ -1,7 +1,5 @@
 """Test read arguments function for REANA templates."""
 
-import pytest
-
 from benchtmpl.io.scanner import Scanner, ListReader
 from benchtmpl.workflow.parameter.base import TemplateParameter, AS_INPUT
 from benchtmpl.workflow.template.base import TemplateHandle
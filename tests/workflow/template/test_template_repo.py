@@ -1,9 +1,10 @@
 """Test functionality of the default template repository implementation."""
 
+import git
 import os
 import pytest
+import shutil
 
-from benchtmpl.workflow.template.base import TemplateHandle
 from benchtmpl.workflow.template.loader import DefaultTemplateLoader
 from benchtmpl.workflow.template.repo import TemplateRepository
 from benchtmpl.workflow.template.repo import STATIC_FILES_DIR, TEMPLATE_FILE
@@ -27,9 +28,18 @@ class DummyIDFunc():
         return '0000'
 
 
+def fake_clone(url, to_path):
+    """Replacement for git.Repo.clone_from that creates a repository folder
+    without a template specification file.
+    """
+    os.makedirs(to_path)
+    with open(os.path.join(to_path, 'reana.yaml'), 'w') as f:
+        f.write('version: 0.3.0\n')
+
+
 class TestTemplateRepository(object):
     """Test functionality of default template repository."""
-    def test_add_template(self, tmpdir):
+    def test_add_template(self, monkeypatch, tmpdir):
         """Test creating templates."""
         store = TemplateRepository(base_dir=str(tmpdir))
         template = store.add_template(src_dir=WORKFLOW_DIR)
@@ -43,6 +53,13 @@ class TestTemplateRepository(object):
         self.validate_template_handle(store.get_template(template.identifier))
         store = TemplateRepository(base_dir=str(tmpdir))
         self.validate_template_handle(store.get_template(template.identifier))
+        # Modifying a template handle does not affect other handles for the
+        # same template
+        handle = store.get_template(template.identifier)
+        handle.workflow_spec['inputs'] = None
+        self.validate_template_handle(store.get_template(template.identifier))
+        store = TemplateRepository(base_dir=str(tmpdir))
+        self.validate_template_handle(store.get_template(template.identifier))
         # Add template with JSON specification file
         template = store.add_template(
             src_dir=WORKFLOW_DIR,
@@ -60,10 +77,54 @@ class TestTemplateRepository(object):
         # Load templates with erroneous specifications
         with pytest.raises(err.InvalidTemplateError):
             store.add_template(src_dir=WORKFLOW_DIR, template_spec_file=ERR_SPEC)
-        # Error when cloning invalid repository from GitHub
+        # Error when cloning a repository that does not contain a template
+        # specification. Avoid accessing the network by replacing the clone
+        # function.
+        monkeypatch.setattr(git.Repo, 'clone_from', staticmethod(fake_clone))
         with pytest.raises(err.InvalidTemplateError):
             store.add_template(src_repo_url='https://github.com/reanahub/reana-demo-helloworld')
 
+    def test_add_template_with_links(self, tmpdir):
+        """Test creating templates with links to the static files."""
+        src_dir = os.path.join(str(tmpdir), 'src')
+        shutil.copytree(src=WORKFLOW_DIR, dst=src_dir)
+        store = TemplateRepository(
+            base_dir=os.path.join(str(tmpdir), 'repo'),
+            link_files=True
+        )
+        template = store.add_template(src_dir=src_dir)
+        self.validate_template_handle(template)
+        src_file = os.path.join(src_dir, 'code/helloworld.py')
+        dst_file = os.path.join(template.base_dir, 'code/helloworld.py')
+        assert os.path.samefile(src_file, dst_file)
+
+    def test_reuse_template_identifier(self, tmpdir):
+        """Test adding a template with the identifier of a deleted template
+        where the template specification files have the same size and
+        modification time.
+        """
+        src_1 = os.path.join(str(tmpdir), 'src1')
+        src_2 = os.path.join(str(tmpdir), 'src2')
+        shutil.copytree(src=WORKFLOW_DIR, dst=src_1)
+        shutil.copytree(src=WORKFLOW_DIR, dst=src_2)
+        spec_file = os.path.join(src_2, 'template.yaml')
+        with open(spec_file, 'r') as f:
+            spec = f.read()
+        with open(spec_file, 'w') as f:
+            f.write(spec.replace('defaultValue: 10', 'defaultValue: 20'))
+        # Use the same modification time for both specification files
+        for filename in [os.path.join(src_1, 'template.yaml'), spec_file]:
+            os.utime(filename, (1000000000, 1000000000))
+        store = TemplateRepository(
+            base_dir=os.path.join(str(tmpdir), 'repo'),
+            id_func=DummyIDFunc()
+        )
+        template = store.add_template(src_dir=src_1)
+        assert template.get_parameter('sleeptime').default_value == 10
+        assert store.delete_template(template.identifier)
+        template = store.add_template(src_dir=src_2)
+        assert template.get_parameter('sleeptime').default_value == 20
+
     def test_delete_template(self, tmpdir):
         """Ensure correct return values when deleting existing and non-existing
         templates.
@@ -78,6 +139,8 @@ class TestTemplateRepository(object):
         assert not os.path.isfile(f)
         assert not os.path.isdir(d)
         assert not store.delete_template(template.identifier)
+        with pytest.raises(err.UnknownTemplateError):
+            store.get_template(template.identifier)
         # Test deleting after store object is re-instantiated
         template = store.add_template(src_dir=WORKFLOW_DIR)
         store = TemplateRepository(base_dir=str(tmpdir))
@@ -3,9 +3,7 @@
 import os
 import pytest
 
-from benchtmpl.io.files.base import FileHandle
 from benchtmpl.workflow.parameter.base import TemplateParameter
-from benchtmpl.workflow.parameter.value import TemplateArgument
 from benchtmpl.workflow.resource.base import ResourceDescriptor, LABEL_ID
 from benchtmpl.workflow.template.base import TemplateHandle
 from benchtmpl.workflow.template.loader import DefaultTemplateLoader
@@ -41,6 +39,21 @@ class TestTemplateHandle(object):
                 validate=True
             )
 
+    def test_invalid_parent(self):
+        """Ensure that exception is raised if the parent of a parameter is not
+        of type DT_LIST or DT_RECORD.
+        """
+        with pytest.raises(err.InvalidTemplateError):
+            DefaultTemplateLoader().from_dict({
+                    loader.LABEL_WORKFLOW: dict(),
+                    loader.LABEL_PARAMETERS: [
+                        pd.parameter_declaration('A', data_type=pd.DT_INTEGER),
+                        pd.parameter_declaration('B', parent='A')
+                    ]
+                },
+                validate=True
+            )
+
     def test_get_parameter_references(self):
         """Test function to get all parameter references in a workflow
         specification."""
@@ -132,13 +145,27 @@ class TestTemplateHandle(object):
         b = template.get_parameter('B')
         assert b.has_children()
         assert len(b.children) == 2
-        assert 'C' in [p.identifier for p in b.children]
-        assert 'D' in [p.identifier for p in b.children]
+        assert b.has_child('C')
+        assert b.has_child('D')
+        assert not b.has_child('F')
         # Parameter 'E' has one childr 'F'
         e = template.get_parameter('E')
         assert e.has_children()
         assert len(e.children) == 1
-        assert 'F' in [p.identifier for p in e.children]
+        assert e.has_child('F')
+        assert not template.get_parameter('A').has_child('F')
+
+    def test_read_template_file(self):
+        """Test reading template files via the parse cache."""
+        doc = loader.read_template_file(TEMPLATE_YAML_FILE)
+        assert os.path.realpath(TEMPLATE_YAML_FILE) in loader._PARSE_CACHE
+        # Modifying the returned document does not modify the cached document
+        doc[loader.LABEL_WORKFLOW] = None
+        doc = loader.read_template_file(TEMPLATE_YAML_FILE)
+        assert not doc[loader.LABEL_WORKFLOW] is None
+        # JSON files are not cached
+        loader.read_template_file(TEMPLATE_JSON_FILE)
+        assert not os.path.realpath(TEMPLATE_JSON_FILE) in loader._PARSE_CACHE
 
     def test_serialization(self):
         """Test serialization of workflow templates."""
@@ -168,36 +195,20 @@ class TestTemplateHandle(object):
         with pytest.raises(err.InvalidTemplateError):
             ResourceDescriptor.from_dict({LABEL_ID: 'A', 'noname': 'B'})
 
-    def test_simple_replace(self):
+    def test_simple_replace(self, spec_template, spec_arguments):
         """Replace parameter references in simple template with argument values.
         """
-        for filename in [TEMPLATE_YAML_FILE, TEMPLATE_JSON_FILE]:
-            template = DefaultTemplateLoader().load(filename)
-            arguments = {
-                'code': TemplateArgument(
-                    parameter=template.get_parameter('code'),
-                    value=FileHandle('code/helloworld.py')
-                ),
-                'names': TemplateArgument(
-                    parameter=template.get_parameter('names'),
-                    value=FileHandle('data/list-of-names.txt')
-                ),
-                'sleeptime': TemplateArgument(
-                    parameter=template.get_parameter('sleeptime'),
-                    value=10
-                )
-            }
-            spec = tmpl.replace_args(
-                spec=template.workflow_spec,
-                arguments=arguments,
-                parameters=template.parameters
-            )
-            assert spec['inputs']['files'][0] == 'helloworld.py'
-            assert spec['inputs']['files'][1] == 'data/names.txt'
-            assert spec['inputs']['parameters']['helloworld'] == 'code/helloworld.py'
-            assert spec['inputs']['parameters']['inputfile'] == 'data/names.txt'
-            assert spec['inputs']['parameters']['sleeptime'] == 10
-            assert spec['inputs']['parameters']['waittime'] == 5
+        spec = tmpl.replace_args(
+            spec=spec_template.workflow_spec,
+            arguments=spec_arguments,
+            parameters=spec_template.parameters
+        )
+        assert spec['inputs']['files'][0] == 'helloworld.py'
+        assert spec['inputs']['files'][1] == 'data/names.txt'
+        assert spec['inputs']['parameters']['helloworld'] == 'code/helloworld.py'
+        assert spec['inputs']['parameters']['inputfile'] == 'data/names.txt'
+        assert spec['inputs']['parameters']['sleeptime'] == 10
+        assert spec['inputs']['parameters']['waittime'] == 5
 
     def test_sort(self):
         """Test the sort functionality of the template list_parameters method.
@@ -219,3 +230,8 @@ class TestTemplateHandle(object):
         # Get list of sorted parameter identifier from listing
         keys = [p.identifier for p in template.list_parameters()]
         assert keys == ['B', 'C', 'A', 'E', 'D']
+        # Modifying the returned list does not affect the next result
+        parameters = template.list_parameters()
+        parameters.pop()
+        keys = [p.identifier for p in template.list_parameters()]
+        assert keys == ['B', 'C', 'A', 'E', 'D']
@@ -3,8 +3,6 @@ specification.
 """
 
 from benchtmpl.io.files.base import FileHandle
-from benchtmpl.workflow.parameter.base import TemplateParameter
-from benchtmpl.workflow.parameter.value import TemplateArgument
 
 import benchtmpl.workflow.parameter.util as pd
 import benchtmpl.workflow.parameter.value as pr
@@ -101,3 +99,27 @@ class TestReplaceSpecificationParameters(object):
             )
         )
         assert wf['parameters'] == {'sleeptime': 5}
+
+    def test_shared_objects(self):
+        """Test replacing parameter references in a specification that
+        references the same object multiple times (e.g., YAML aliases).
+        """
+        files = ['$[[codeFile]]', 'data/names.txt']
+        spec = {'inputs': {'files': files}, 'outputs': {'files': files}}
+        parameters = pd.create_parameter_index([
+            {
+                'id': 'codeFile',
+                'datatype': 'file',
+                'defaultValue': 'src/helloworld.py'
+            }
+        ])
+        assert tmpl.get_parameter_references(spec) == set(['codeFile'])
+        wf = tmpl.replace_args(
+            spec=spec,
+            parameters=parameters,
+            arguments=dict()
+        )
+        assert wf['inputs']['files'] == ['src/helloworld.py', 'data/names.txt']
+        assert wf['inputs']['files'] is wf['outputs']['files']
+        # The original specification is not modified
+        assert files == ['$[[codeFile]]', 'data/names.txt']
@@ -169,40 +169,30 @@ class TestParameterValidation(object):
         assert p.get(pd.LABEL_INDEX) == 0
         assert p.get(pd.LABEL_REQUIRED)
 
+    def test_validate_declaration(self):
+        """Ensure that creating a dictionary from a valid parameter declaration
+        is still valid.
+        """
+        pd.validate_parameter(dict(pd.parameter_declaration(identifier='ABC')))
 
-    def test_validate_error(self):
+    @pytest.mark.parametrize(
+        'label,value',
+        [
+            (pd.LABEL_ID, 123),
+            (pd.LABEL_NAME, 123),
+            (pd.LABEL_DATATYPE, 12.3),
+            (pd.LABEL_INDEX, '12'),
+            (pd.LABEL_REQUIRED, '12')
+        ]
+    )
+    def test_validate_error(self, label, value):
         """Assert that errors are raised if an invalid parameter declaration is
         given to the validate_parameter function.
         """
         p = pd.parameter_declaration(identifier='ABC')
-        # Ensure that creating a dictionary from a valid parameter declaration
-        # is still valid
-        pd.validate_parameter(dict(p))
-        # Invalid data type for parameter identifier
-        p_invalid = dict(p)
-        p_invalid[pd.LABEL_ID] = 123
-        with pytest.raises(err.InvalidParameterError):
-            pd.validate_parameter(p_invalid)
-        # Invalid data type for parameter name
-        p_invalid = dict(p)
-        p_invalid[pd.LABEL_NAME] = 123
-        with pytest.raises(err.InvalidParameterError):
-            pd.validate_parameter(p_invalid)
-        # Invalid data type for parameter data type
-        p_invalid = dict(p)
-        p_invalid[pd.LABEL_DATATYPE] = 12.3
+        p[label] = value
         with pytest.raises(err.InvalidParameterError):
-            pd.validate_parameter(p_invalid)
-        # Invalid data type for parameter index
-        p_invalid = dict(p)
-        p_invalid[pd.LABEL_INDEX] = '12'
-        with pytest.raises(err.InvalidParameterError):
-            pd.validate_parameter(p_invalid)
-        # Invalid data type for parameter required
-        p_invalid = dict(p)
-        p_invalid[pd.LABEL_REQUIRED] = '12'
-        with pytest.raises(err.InvalidParameterError):
-            pd.validate_parameter(p_invalid)
+            pd.validate_parameter(p)
 
     def validate_value(self, obj, value, name, is_default):
         """Validate element in a parameter value enumeration."""
@@ -14,6 +14,55 @@ DIR = os.path.dirname(os.path.realpath(__file__))
 LOCAL_FILE = os.path.join(DIR, '../.files/schema.json')
 
 
+@pytest.fixture(scope='module')
+def file_resource():
+    """File resource for the local schema file that is shared by all tests in
+    the module. Workflow states do not modify the resources that they hold.
+    """
+    return FileResource('myfile', LOCAL_FILE)
+
+
+@pytest.fixture(scope='module')
+def timestamps():
+    """Timestamps for the creation, start, and end of a workflow run that are
+    shared by all tests in the module.
+    """
+    created_at = dt.datetime.now()
+    started_at = created_at + dt.timedelta(seconds=10)
+    stopped_at = started_at + dt.timedelta(seconds=10)
+    return created_at, started_at, stopped_at
+
+
+"""Names of the state type methods and the list of methods that are expected
+to return True for each of the workflow state classes. States are created by
+factory functions that take the timestamps fixture as their argument.
+"""
+STATE_FLAGS = ['is_active', 'is_error', 'is_pending', 'is_running', 'is_success']
+STATE_CASES = [
+    (
+        lambda ts: StateError(
+            created_at=ts[0],
+            started_at=ts[1],
+            stopped_at=ts[2]
+        ),
+        ['is_error']
+    ),
+    (lambda ts: StatePending(ts[0]), ['is_active', 'is_pending']),
+    (
+        lambda ts: StateRunning(created_at=ts[0], started_at=ts[1]),
+        ['is_active', 'is_running']
+    ),
+    (
+        lambda ts: StateSuccess(
+            created_at=ts[0],
+            started_at=ts[1],
+            finished_at=ts[2]
+        ),
+        ['is_success']
+    )
+]
+
+
 class TestWorkflowStates(object):
     """Test instantiating the different workflow state classes."""
     def test_deserialize_error(self):
@@ -21,79 +70,42 @@ class TestWorkflowStates(object):
         with pytest.raises(ValueError):
             WorkflowState.from_dict({LABEL_STATE_TYPE: 'unknown'})
 
-    def test_error_state(self):
+    @pytest.mark.parametrize(
+        'messages,count',
+        [(None, 0), (['A', 'B', 'C'], 3)]
+    )
+    def test_error_state(self, timestamps, messages, count):
         """Test creating instances of the error state class."""
-        created_at = dt.datetime.now()
-        started_at = created_at + dt.timedelta(seconds=10)
-        stopped_at = started_at + dt.timedelta(seconds=10)
-        state = StateError(
-            created_at=created_at,
-            started_at=started_at,
-            stopped_at=stopped_at
-        )
-        assert state.is_error()
-        assert not state.is_pending()
-        assert not state.is_running()
-        assert not state.is_success()
-        assert not state.is_active()
-        assert state.created_at == created_at
-        assert state.started_at == started_at
-        assert state.stopped_at == stopped_at
-        assert len(state.messages) == 0
+        created_at, started_at, stopped_at = timestamps
         state = StateError(
             created_at=created_at,
             started_at=started_at,
             stopped_at=stopped_at,
-            messages=['A', 'B', 'C']
+            messages=messages
         )
-        assert state.created_at == created_at
-        assert state.started_at == started_at
-        assert state.stopped_at == stopped_at
-        assert len(state.messages) == 3
-        # Test serialization and deserialization
-        state = WorkflowState.from_dict(state.to_dict())
-        assert state.is_error()
-        assert not state.is_pending()
-        assert not state.is_running()
-        assert not state.is_success()
-        assert not state.is_active()
-        assert state.created_at == created_at
-        assert state.started_at == started_at
-        assert state.stopped_at == stopped_at
-        assert len(state.messages) == 3
+        # Test the state before and after serialization and deserialization
+        for obj in [state, WorkflowState.from_dict(state.to_dict())]:
+            assert obj.created_at == created_at
+            assert obj.started_at == started_at
+            assert obj.stopped_at == stopped_at
+            assert len(obj.messages) == count
 
-    def test_pending_state(self):
+    def test_pending_state(self, timestamps):
         """Test creating instances of the pending state class."""
-        created_at = dt.datetime.now()
+        created_at, _, _ = timestamps
         state = StatePending(created_at)
-        assert state.is_pending()
-        assert state.is_active()
-        assert not state.is_error()
-        assert not state.is_running()
-        assert not state.is_success()
         assert state.created_at == created_at
         running = state.start()
         assert state.created_at == running.created_at
         assert not running.started_at is None
         # Test serialization and deserialization
         state = WorkflowState.from_dict(state.to_dict())
-        assert (state.is_pending())
-        assert state.is_active()
-        assert not state.is_error()
-        assert not state.is_running()
-        assert not state.is_success()
         assert state.created_at == created_at
 
-    def test_running_state(self):
+    def test_running_state(self, timestamps, file_resource):
         """Test creating instances of the running state class."""
-        created_at = dt.datetime.now()
-        started_at = created_at + dt.timedelta(seconds=10)
+        created_at, started_at, _ = timestamps
         state = StateRunning(created_at=created_at, started_at=started_at)
-        assert state.is_active()
-        assert state.is_running()
-        assert not state.is_pending()
-        assert not state.is_error()
-        assert not state.is_success()
         assert state.created_at == created_at
         assert state.started_at == started_at
         # Create an exception to get error state fromrunning state
@@ -104,41 +116,35 @@ class TestWorkflowStates(object):
         assert error.messages[0] == 'Error'
         assert error.messages[1] == 'State'
         success = state.success(
-            resources={'myfile': FileResource('myfile', LOCAL_FILE)}
+            resources={'myfile': file_resource}
         )
         assert success.is_success()
-        assert not success.is_error()
-        assert not success.is_pending()
-        assert not success.is_running()
-        assert not success.is_active()
         assert success.created_at == state.created_at
         assert success.started_at == state.started_at
         assert len(success.resources) == 1
         # Test serialization and deserialization
         state = WorkflowState.from_dict(state.to_dict())
-        assert state.is_active()
-        assert state.is_running()
-        assert not state.is_pending()
-        assert not state.is_error()
-        assert not state.is_success()
         assert state.created_at == created_at
         assert state.started_at == started_at
 
-    def test_success_state(self):
+    @pytest.mark.parametrize('factory,expected', STATE_CASES)
+    def test_state_flags(self, timestamps, factory, expected):
+        """Test the state type methods for the different workflow state
+        classes before and after serialization.
+        """
+        state = factory(timestamps)
+        flags = tuple(flag in expected for flag in STATE_FLAGS)
+        for obj in [state, WorkflowState.from_dict(state.to_dict())]:
+            assert tuple(getattr(obj, f)() for f in STATE_FLAGS) == flags
+
+    def test_success_state(self, timestamps, file_resource):
         """Test creating instances of the success state class."""
-        created_at = dt.datetime.now()
-        started_at = created_at + dt.timedelta(seconds=10)
-        finished_at = started_at + dt.timedelta(seconds=10)
+        created_at, started_at, finished_at = timestamps
         state = StateSuccess(
             created_at=created_at,
             started_at=started_at,
             finished_at=finished_at
         )
-        assert state.is_success()
-        assert not state.is_error()
-        assert not state.is_pending()
-        assert not state.is_running()
-        assert not state.is_active()
         assert state.created_at == created_at
         assert state.started_at == started_at
         assert state.finished_at == finished_at
@@ -147,7 +153,7 @@ class TestWorkflowStates(object):
             created_at=created_at,
             started_at=started_at,
             finished_at=finished_at,
-            resources=[FileResource('myfile', LOCAL_FILE)]
+            resources=[file_resource]
         )
         assert state.created_at == created_at
         assert state.started_at == started_at
@@ -155,11 +161,6 @@ class TestWorkflowStates(object):
         assert len(state.resources) == 1
         # Test serialization and deserialization
         state = WorkflowState.from_dict(state.to_dict())
-        assert state.is_success()
-        assert not state.is_error()
-        assert not state.is_pending()
-        assert not state.is_running()
-        assert not state.is_active()
         assert state.created_at == created_at
         assert state.started_at == started_at
         assert state.finished_at == finished_at
@@ -170,5 +171,5 @@ class TestWorkflowStates(object):
                 created_at=created_at,
                 started_at=started_at,
                 finished_at=finished_at,
-                resources=FileResource('myfile', LOCAL_FILE)
+                resources=file_resource
             )